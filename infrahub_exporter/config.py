@@ -2,9 +2,14 @@ import os
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_settings import BaseSettings
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML bindings
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 # --- Metrics Configuration ---
 class MetricsKind(BaseModel):
@@ -14,6 +19,17 @@ class MetricsKind(BaseModel):
     include: list[str] = Field(default_factory=list)
     filters: list[dict[str, str]] = Field(default_factory=list)
 
+    _merged_filters: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._merged_filters = {key: value for f in self.filters for key, value in f.items()}
+
+    @property
+    def merged_filters(self) -> dict[str, str]:
+        """All filters flattened into a single dict of query arguments."""
+        return self._merged_filters
+
 
 class MetricsConfig(BaseModel):
     """Configuration for metrics collection."""
@@ -52,6 +68,23 @@ class ExportersConfig(BaseModel):
 
 
 # --- Service Discovery Configuration ---
+PATH_GET = "get"
+PATH_ARRAY = "array"
+
+FieldPath = tuple[tuple[str, str], ...]
+
+
+def compile_field_path(path_expr: str) -> FieldPath:
+    """Parse a dot-notation field path into (op, key) steps; `name[]` becomes an array step."""
+    steps: list[tuple[str, str]] = []
+    for part in path_expr.split("."):
+        if part.endswith("[]"):
+            steps.append((PATH_ARRAY, part[:-2]))
+        else:
+            steps.append((PATH_GET, part))
+    return tuple(steps)
+
+
 class ServiceDiscoveryQuery(BaseModel):
     """Configuration for a single service discovery GraphQL query."""
 
@@ -62,9 +95,22 @@ class ServiceDiscoveryQuery(BaseModel):
     port_field: str | None = None
     name: str | None = None
 
+    _compiled_paths: dict[str, FieldPath] = PrivateAttr(default_factory=dict)
+
     def __init__(self, **data: Any):
         super().__init__(**data)
         self.name: str | None = self.file_path.split("/")[-1].split(".")[0]
+        paths = [self.target_field, *self.label_mappings.values()]
+        if self.port_field:
+            paths.append(self.port_field)
+        self._compiled_paths = {path: compile_field_path(path) for path in paths}
+
+    def compiled_path(self, path_expr: str) -> FieldPath:
+        """Return the pre-parsed steps for one of this query's field paths."""
+        steps = self._compiled_paths.get(path_expr)
+        if steps is None:
+            steps = self._compiled_paths[path_expr] = compile_field_path(path_expr)
+        return steps
 
 
 class ServiceDiscoveryConfig(BaseModel):
@@ -83,6 +129,7 @@ class SidecarSettings(BaseSettings):
     service_discovery: ServiceDiscoveryConfig = Field(default_factory=ServiceDiscoveryConfig)
     metrics: MetricsConfig = Field(default_factory=MetricsConfig)
     poll_interval_seconds: int = Field(default=60, gt=1)
+    max_concurrent_fetches: int = Field(default=4, gt=0)
     listen_address: str = Field(default="0.0.0.0")
     listen_port: int = Field(default=8001, gt=0)
     log_level: str = Field(default="INFO")
@@ -98,7 +145,7 @@ class SidecarSettings(BaseSettings):
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
         with open(path, "r") as f:
-            raw = yaml.safe_load(f)
+            raw = yaml.load(f.read(), Loader=_YamlLoader)
 
         if not isinstance(raw, dict) or not raw:
             raise ValueError(f"Empty or invalid YAML in configuration file: {path}")
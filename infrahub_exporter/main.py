@@ -1,8 +1,12 @@
 import argparse
 import asyncio
+import gzip
 import logging
 import sys
+import time
+from typing import Any
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse, PlainTextResponse
@@ -13,6 +17,11 @@ from .config import ServiceDiscoveryConfig, ServiceDiscoveryQuery, SidecarSettin
 from .metrics_exporter import MetricsExporter
 from .service_discovery import ServiceDiscoveryManager
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None  # type: ignore[assignment]
+
 # Setup root logger
 logger = logging.getLogger("infrahub-sidecar")
 handler = logging.StreamHandler(sys.stdout)
@@ -20,6 +29,13 @@ handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s -
 logger.addHandler(handler)
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 class Server:
     """HTTP server for health, metrics, and service-discovery endpoints."""
 
@@ -29,13 +45,24 @@ class Server:
         client: InfrahubClient,
         listen_address: str,
         listen_port: int,
+        poll_interval_seconds: int = 60,
     ):
         self.sd_config = sd_config
         self.client = client
         self.listen_address = listen_address
         self.listen_port = listen_port
+        self.poll_interval_seconds = poll_interval_seconds
+        # (render time, plain body, gzip body)
+        self._metrics_cache: tuple[float, bytes, bytes] | None = None
         self.app = FastAPI(title="Infrahub Sidecar")
         self.sd_manager = ServiceDiscoveryManager(client) if sd_config and sd_config.enabled else None
+        self._sd_queries: dict[str, ServiceDiscoveryQuery] = (
+            {q.name: q for q in sd_config.queries if q.name} if self.sd_manager and sd_config else {}
+        )
+        self._sd_response_headers: dict[str, dict[str, str]] = {
+            name: {"X-Prometheus-Refresh-Interval-Seconds": str(q.refresh_interval_seconds)}
+            for name, q in self._sd_queries.items()
+        }
         self._setup_routes()
 
     def _setup_routes(self) -> None:
@@ -44,48 +71,67 @@ class Server:
             return PlainTextResponse("OK")
 
         @self.app.get("/metrics")
-        async def metrics() -> Response:
-            data = generate_latest(REGISTRY)
+        async def metrics(request: Request) -> Response:
+            cache = self._metrics_cache
+            if not cache or (time.monotonic() - cache[0]) >= self.poll_interval_seconds:
+                cache = self._render_metrics()
+            if "gzip" in request.headers.get("accept-encoding", ""):
+                return Response(
+                    content=cache[2],
+                    media_type="text/plain; version=0.0.4",
+                    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+                )
             return Response(
-                content=data,
+                content=cache[1],
                 media_type="text/plain; version=0.0.4",
+                headers={"Vary": "Accept-Encoding"},
             )
 
         logger.info("Registered metrics endpoint: /metrics")
 
-        if self.sd_manager and self.sd_config and self.sd_config.queries:
-            for query in self.sd_config.queries:
-                path = f"/sd/{query.name}"
+        if self._sd_queries:
+
+            @self.app.get("/sd/{name}")
+            async def sd_endpoint(name: str) -> JSONResponse:
+                query = self._sd_queries.get(name)
+                if not query:
+                    return ORJSONResponse(content=[], status_code=404)
+                return await self._handle_sd(query)
+
+            for name in self._sd_queries:
+                logger.info("Registered SD endpoint: /sd/%s", name)
 
-                @self.app.get(path)
-                async def sd_endpoint(req: Request, q: ServiceDiscoveryQuery = query) -> JSONResponse:
-                    return await self._handle_sd(q)
+    def _render_metrics(self) -> tuple[float, bytes, bytes]:
+        data = generate_latest(REGISTRY)
+        self._metrics_cache = (time.monotonic(), data, gzip.compress(data, compresslevel=1))
+        return self._metrics_cache
 
-                logger.info(f"Registered SD endpoint: {path}")
+    def refresh_metrics_cache(self) -> None:
+        """Re-render the /metrics body once the exporter has stored fresh data."""
+        self._render_metrics()
 
     async def _handle_sd(self, query: ServiceDiscoveryQuery) -> JSONResponse:
         if self.sd_manager:
             try:
                 targets = await self.sd_manager.get_targets(query)
-                resp = JSONResponse(content=targets)
-                resp.headers["X-Prometheus-Refresh-Interval-Seconds"] = str(query.refresh_interval_seconds)
-                return resp
+                return ORJSONResponse(content=targets, headers=self._sd_response_headers.get(query.name or ""))
             except Exception as e:
-                logger.error(f"SD '{query.name}' error: {e}")
-                return JSONResponse(content=[], status_code=500)
+                logger.error("SD '%s' error: %s", query.name, e)
+                return ORJSONResponse(content=[], status_code=500)
 
-        return JSONResponse(content=[], status_code=404)
+        return ORJSONResponse(content=[], status_code=404)
 
     async def start(self) -> None:
         config = uvicorn.Config(
             app=self.app,
             host=self.listen_address,
             port=self.listen_port,
+            http="httptools",
             log_level=logging.getLevelName(logger.level).lower(),
         )
         server = uvicorn.Server(config)
         asyncio.create_task(server.serve())
-        logger.info(f"Server listening on {self.listen_address}:{self.listen_port}")
+        logger.info("Server listening on %s:%s", self.listen_address, self.listen_port)
 
     async def stop(self) -> None:
         logger.info("Stopping server...")
@@ -105,14 +151,14 @@ async def main() -> None:
     try:
         cfg = SidecarSettings.load(args.config)
     except Exception as e:
-        logger.error(f"Failed to load config: {e}")
+        logger.error("Failed to load config: %s", e)
         sys.exit(1)
 
     if args.log_level:
         logger.setLevel(args.log_level)
     else:
         logger.setLevel(cfg.log_level)
-    logger.info(f"Config loaded from {args.config}")
+    logger.info("Config loaded from %s", args.config)
 
     client = InfrahubClient(
         address=cfg.infrahub.address,
@@ -134,7 +180,9 @@ async def main() -> None:
         client=client,
         listen_address=cfg.listen_address,
         listen_port=cfg.listen_port,
+        poll_interval_seconds=cfg.poll_interval_seconds,
     )
+    metrics_exporter.add_store_listener(server.refresh_metrics_cache)
     await server.start()
 
     try:
@@ -149,6 +197,9 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         pass
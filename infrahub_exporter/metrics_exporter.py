@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, Generator
+from typing import Any, Callable, Generator
 
 from infrahub_sdk import InfrahubClient
 from infrahub_sdk.exceptions import SchemaNotFoundError
@@ -20,14 +20,6 @@ from .config import MetricsKind, SidecarSettings
 logger = logging.getLogger(name="infrahub-sidecar")
 
 
-class MetricEntry:
-    """Represents a single metric data point with labels and value."""
-
-    def __init__(self, labels: dict[str, Any], value: int) -> None:
-        self.labels = labels
-        self.value = value
-
-
 class MetricsExporter(Collector):
     """Unified metrics exporter for Prometheus and OTLP based on configured kinds."""
 
@@ -35,21 +27,32 @@ class MetricsExporter(Collector):
         def __init__(self, kp: MetricsKind, exporter: "MetricsExporter") -> None:
             self.kp = kp
             self.exporter = exporter
+            self._labels = ("id", "hfid", *kp.include)
 
         def _otlp_callback(self, options: Any | None) -> Generator[Observation, None, None]:
             """Callback to emit current OTLP metrics."""
-            labels = ["id", "hfid"] + self.kp.include
-            for entry in self.exporter._store[self.kp.kind]:
-                yield Observation(
-                    value=entry.value,
-                    attributes={label: entry.labels.get(label, "") for label in labels},
-                )
+            labels = self._labels
+            for row in self.exporter._store.get(self.kp.kind, []):
+                yield Observation(value=1, attributes=dict(zip(labels, row)))
 
     def __init__(self, client: InfrahubClient, settings: SidecarSettings) -> None:
         self.client = client
         self.settings = settings
-        self._store: dict[str, list[MetricEntry]] = {}
+        # kind -> rows of label values, ordered as in _label_names[kind]
+        self._store: dict[str, list[tuple[str, ...]]] = {}
+        self._store_version = 0
+        self._cached_families: list[GaugeMetricFamily] = []
+        self._cached_families_version = -1
+        self._kind_index: dict[str, MetricsKind] = {}
+        self._label_names: dict[str, list[str]] = {}
+        self._metric_name: dict[str, str] = {}
         self._poll_task: asyncio.Task | None = None
+        self._sem = asyncio.Semaphore(settings.max_concurrent_fetches)
+        self._store_listeners: list[Callable[[], None]] = []
+
+    def add_store_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked after each poll cycle refreshes the store."""
+        self._store_listeners.append(listener)
 
     def register_prometheus(self) -> None:
         """Register this instance as a Prometheus collector."""
@@ -69,11 +72,10 @@ class MetricsExporter(Collector):
         meter = otel_metrics.get_meter(__name__)
 
         for kp in self.settings.metrics.kind:
-            metric_name = f"infrahub_{kp.kind.lower()}_info"
             metric_meter = self.MetricMeter(kp=kp, exporter=self)
 
             meter.create_observable_gauge(
-                name=metric_name,
+                name=self._metric_name[kp.kind],
                 description=f"Info about Infrahub {kp.kind}",
                 callbacks=[metric_meter._otlp_callback],
             )
@@ -81,33 +83,47 @@ class MetricsExporter(Collector):
 
     def collect(self) -> Generator[GaugeMetricFamily, None, None]:
         """Prometheus collect method: yield metrics from store."""
-        for kind, entries in self._store.items():
-            # Find the corresponding MetricsKind config
-            kp = next((k for k in self.settings.metrics.kind if k.kind == kind), None)
-            if not kp:
-                continue
-            metric_name = f"infrahub_{kind.lower()}_info"
-            labels = ["id", "hfid"] + kp.include
-            metric = GaugeMetricFamily(
-                metric_name,
-                f"Info about Infrahub {kind}",
-                labels=labels,
-            )
-            for entry in entries:
-                metric.add_metric(
-                    [entry.labels.get(label, "") for label in labels],
-                    entry.value,
+        # The families only change when the store is swapped, so reuse them between polls
+        if self._cached_families_version != self._store_version:
+            families: list[GaugeMetricFamily] = []
+            for kind, rows in self._store.items():
+                if kind not in self._kind_index:
+                    continue
+                metric = GaugeMetricFamily(
+                    self._metric_name[kind],
+                    f"Info about Infrahub {kind}",
+                    labels=self._label_names[kind],
                 )
-            yield metric
+                for row in rows:
+                    metric.add_metric(row, 1)
+                families.append(metric)
+            self._cached_families = families
+            self._cached_families_version = self._store_version
+        yield from self._cached_families
+
+    async def _fetch_and_store(
+        self, kp: MetricsKind, store: dict[str, list[tuple[str, ...]]], hfid_cache: dict[str, str]
+    ) -> None:
+        """Fetch one kind into `store`, bounded by the concurrent fetch limit."""
+        async with self._sem:
+            await self._fetch_kind(kp, store, hfid_cache)
+
+    @staticmethod
+    def _peer_label(node: InfrahubNode, hfid_cache: dict[str, str]) -> str:
+        """Return the HFID (or id) of a peer, memoized for the current poll cycle."""
+        label = hfid_cache.get(node.id)
+        if label is None:
+            label = hfid_cache[node.id] = node.get_human_friendly_id_as_string(include_kind=True) or node.id
+        return label
 
-    async def _fetch_and_store(self, kp: MetricsKind) -> None:
-        """Fetch items for one kind and store MetricEntry list."""
+    async def _fetch_kind(
+        self, kp: MetricsKind, store: dict[str, list[tuple[str, ...]]], hfid_cache: dict[str, str]
+    ) -> None:
+        """Fetch items for one kind and store one row of label values per item."""
         try:
             items: list[InfrahubNode] = []
-            logger.debug(f"Fetching items for kind '{kp.kind}'")
-            filter_args: dict[str, Any] = {}
-            for f in kp.filters:
-                filter_args.update(f)
+            logger.debug("Fetching items for kind '%s'", kp.kind)
+            filter_args: dict[str, Any] = kp.merged_filters
 
             if filter_args:
                 items = await self.client.filters(
@@ -122,14 +138,55 @@ class MetricsExporter(Collector):
                     include=kp.include,
                     branch=self.settings.infrahub.branch,
                 )
-            logger.debug(f"Fetched {len(items)} items for kind '{kp.kind}'")
+            logger.debug("Fetched %d items for kind '%s'", len(items), kp.kind)
 
         except SchemaNotFoundError:
-            logger.error(f"Schema not found for kind '{kp.kind}'")
+            logger.error("Schema not found for kind '%s'", kp.kind)
         except Exception as exc:
-            logger.error(f"Error fetching items for kind '{kp.kind}': {exc}")
+            logger.error("Error fetching items for kind '%s': %s", kp.kind, exc)
 
-        entries: list[MetricEntry] = []
+        store_get = self.client.store.get
+
+        # First pass: collect the peers to fetch, grouped by kind so each kind is one bulk query
+        ids_per_kind: dict[str, set[str]] = {}
+        for itm in items:
+            for field in kp.include:
+                attr = getattr(itm, field, None)
+                if isinstance(attr, RelatedNode):
+                    if attr.initialized and attr.id and attr.typename:
+                        ids_per_kind.setdefault(attr.typename, set()).add(attr.id)
+                elif isinstance(attr, RelationshipManager):
+                    if attr.initialized:
+                        for p in attr.peers:
+                            if p.id and p.typename and not store_get(key=p.id, raise_when_missing=False):
+                                ids_per_kind.setdefault(p.typename, set()).add(p.id)
+
+        fetched: dict[str, InfrahubNode] = {}
+        if ids_per_kind:
+            results = await asyncio.gather(
+                *(
+                    self.client.filters(
+                        kind=peer_kind,
+                        ids=list(ids),
+                        populate_store=True,
+                        branch=self.settings.infrahub.branch,
+                        parallel=True,
+                    )
+                    for peer_kind, ids in ids_per_kind.items()
+                ),
+                return_exceptions=True,
+            )
+            for peer_kind, result in zip(ids_per_kind, results):
+                if isinstance(result, BaseException):
+                    logger.warning("Unable to fetch '%s' peers for kind '%s': %s", peer_kind, kp.kind, result)
+                    continue
+                for fetched_node in result:
+                    if fetched_node.id:
+                        fetched[fetched_node.id] = fetched_node
+
+        # Second pass: build the label rows from the fetched peers and the client store
+        label_names = self._label_names[kp.kind]
+        rows: list[tuple[str, ...]] = []
         for itm in items:
             labels: dict[str, Any] = {
                 "id": str(itm.id or ""),
@@ -144,41 +201,59 @@ class MetricsExporter(Collector):
                     continue
                 # Relationship (single)
                 if isinstance(attr, RelatedNode):
-                    if attr.initialized:
-                        await attr.fetch()
-                        peer = itm._client.store.get(key=attr.peer.id, raise_when_missing=False)
+                    if attr.initialized and attr.id:
+                        peer = fetched.get(attr.id) or store_get(key=attr.id, raise_when_missing=False)
                         if peer:
-                            val = peer.get_human_friendly_id_as_string(include_kind=True) or peer.id
+                            val = self._peer_label(peer, hfid_cache)
                 # Relationship (multiple)
                 elif isinstance(attr, RelationshipManager):
                     if attr.initialized:
                         peers = []
                         for p in attr.peers:
-                            node = itm._client.store.get(key=p.id, raise_when_missing=False)
-                            if not node:
-                                await p.fetch()
-                                node = p.peer
-                            peers.append(node.get_human_friendly_id_as_string(include_kind=True) or node.id)
+                            if not p.id:
+                                continue
+                            node = fetched.get(p.id) or store_get(key=p.id, raise_when_missing=False)
+                            if node:
+                                peers.append(self._peer_label(node, hfid_cache))
                         val = ",".join(peers)
                 # Attribute
                 else:
                     val = getattr(attr, "value", None)
                 labels[field] = str(val or "")
 
-            entries.append(MetricEntry(labels=labels, value=1))
+            rows.append(tuple(labels.get(label, "") for label in label_names))
 
-        self._store[kp.kind] = entries
+        store[kp.kind] = rows
 
     async def _poll_loop(self) -> None:
-        """Background loop to fetch metrics periodically."""
+        """Background loop to fetch metrics periodically, on a fixed schedule that absorbs fetch time."""
         interval = self.settings.poll_interval_seconds
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         while True:
-            tasks = [self._fetch_and_store(kp) for kp in self.settings.metrics.kind]
+            # Fill a fresh store and swap it in so collect() never sees a partial update
+            new_store: dict[str, list[tuple[str, ...]]] = {}
+            hfid_cache: dict[str, str] = {}
+            tasks = [self._fetch_and_store(kp, new_store, hfid_cache) for kp in self.settings.metrics.kind]
             await asyncio.gather(*tasks)
-            await asyncio.sleep(interval)
+            self._store = new_store
+            self._store_version += 1
+            for listener in self._store_listeners:
+                listener()
+
+            next_tick += interval
+            sleep_for = next_tick - loop.time()
+            if sleep_for < 0:
+                logger.warning("Poll cycle overran the %ds interval by %.2fs", interval, -sleep_for)
+                next_tick = loop.time()
+                sleep_for = 0
+            await asyncio.sleep(sleep_for)
 
     async def start(self) -> None:
         """Initialize exporters and start polling loop."""
+        self._kind_index = {kp.kind: kp for kp in self.settings.metrics.kind}
+        self._label_names = {kp.kind: ["id", "hfid"] + kp.include for kp in self.settings.metrics.kind}
+        self._metric_name = {kp.kind: f"infrahub_{kp.kind.lower()}_info" for kp in self.settings.metrics.kind}
         if self.settings.exporters.prometheus.enabled:
             self.register_prometheus()
         if self.settings.exporters.otlp.enabled:
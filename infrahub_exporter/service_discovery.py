@@ -7,7 +7,7 @@ from infrahub_sdk import InfrahubClient
 from infrahub_sdk.exceptions import GraphQLError
 from pydantic import BaseModel
 
-from .config import ServiceDiscoveryQuery
+from .config import PATH_ARRAY, FieldPath, ServiceDiscoveryQuery
 
 logger = logging.getLogger(name="infrahub-sidecar")
 
@@ -25,6 +25,7 @@ class ServiceDiscoveryManager:
     def __init__(self, client: InfrahubClient):
         self.client = client
         self._cache: dict[str, CachedTargets] = {}
+        self._gql_files: dict[str, tuple[float, str]] = {}
 
     async def get_targets(self, query: ServiceDiscoveryQuery) -> list[dict[str, Any]]:
         """Return cached targets or fetch fresh if TTL expired."""
@@ -34,11 +35,11 @@ class ServiceDiscoveryManager:
             cached = self._cache.get(query.name)
 
             if cached and (now - cached.timestamp) < query.refresh_interval_seconds:
-                logger.debug(f"Returning cached SD for '{query.name}'")
+                logger.debug("Returning cached SD for '%s'", query.name)
                 return cached.targets
 
             targets = await self._fetch_and_transform(query)
-            self._cache[query.name] = CachedTargets(timestamp=now, targets=targets)
+            self._cache[query.name] = CachedTargets.model_construct(timestamp=now, targets=targets)
         return targets
 
     async def _fetch_and_transform(self, query: ServiceDiscoveryQuery) -> list[dict[str, Any]]:
@@ -48,9 +49,9 @@ class ServiceDiscoveryManager:
             path = Path.cwd() / query.file_path
 
         try:
-            content = path.read_text(encoding="utf-8")
+            content = self._read_query_file(path)
         except Exception as e:
-            logger.error(f"Cannot read query file {path}: {e}")
+            logger.error("Cannot read query file %s: %s", path, e)
             return []
 
         try:
@@ -58,12 +59,16 @@ class ServiceDiscoveryManager:
                 query=content,
             )
         except GraphQLError as e:
-            logger.error(f"GraphQL errors in '{query.name}': {e}")
+            logger.error("GraphQL errors in '%s': %s", query.name, e)
             return []
         except Exception as e:
-            logger.error(f"GraphQL execution failed for '{query.name}': {e}")
+            logger.error("GraphQL execution failed for '%s': %s", query.name, e)
             return []
 
+        target_steps = query.compiled_path(query.target_field)
+        port_steps = query.compiled_path(query.port_field) if query.port_field else None
+        label_steps = [(key, query.compiled_path(field_path)) for key, field_path in query.label_mappings.items()]
+
         raw = resp
         targets: list[dict[str, Any]] = []
         for kind_name, data_block in raw.items():
@@ -73,17 +78,17 @@ class ServiceDiscoveryManager:
 
             for edge in edges:
                 node = edge.get("node", {})
-                addr = self._extract_field(node, query.target_field)
+                addr = self._extract_field(node, target_steps)
                 if not addr:
                     continue
-                if query.port_field:
-                    port = self._extract_field(node, query.port_field)
+                if port_steps:
+                    port = self._extract_field(node, port_steps)
                     if port:
                         addr = f"{addr}:{port}"
 
                 labels: dict[str, Any] = {}
-                for key, field_path in query.label_mappings.items():
-                    val = self._extract_field(node, field_path)
+                for key, steps in label_steps:
+                    val = self._extract_field(node, steps)
                     if val is not None:
                         label_key = key
                         labels[label_key] = str(val)
@@ -92,19 +97,28 @@ class ServiceDiscoveryManager:
                 labels["__meta_infrahub_kind"] = kind_name
                 targets.append({"targets": [addr], "labels": labels})
 
-        logger.info(f"SD '{query.name}' generated {len(targets)} targets")
+        logger.info("SD '%s' generated %d targets", query.name, len(targets))
         return targets
 
-    def _extract_field(self, node: dict[str, Any], path_expr: str) -> Any:
-        """Extract nested field via dot-notation; handles arrays and GraphQL edges."""
-        parts = path_expr.split(".")
+    def _read_query_file(self, path: Path) -> str:
+        """Return the GQL file content, re-reading it only when its mtime changes."""
+        mtime = path.stat().st_mtime
+        cached = self._gql_files.get(str(path))
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        content = path.read_text(encoding="utf-8")
+        self._gql_files[str(path)] = (mtime, content)
+        return content
+
+    def _extract_field(self, node: dict[str, Any], steps: FieldPath) -> Any:
+        """Extract nested field from compiled dot-notation steps; handles arrays and GraphQL edges."""
         current: Any = node
 
-        for part in parts:
+        for op, part in steps:
             # Handle arrays with [] notation
-            if part.endswith("[]"):
-                arr_field = part[:-2]
-                arr = current.get(arr_field)
+            if op == PATH_ARRAY:
+                arr = current.get(part)
                 values: list[str] = []
                 if isinstance(arr, dict) and "edges" in arr:
                     for entry in arr["edges"]: